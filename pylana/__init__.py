@@ -9,7 +9,7 @@ from pylana.v2 import LanaAPI2
 
 
 def create_api(scheme, host, token, port=None, compatibility=False,
-               url=None, application_root=None, **kwargs):
+               url=None, application_root=None, log_cache_ttl=5., **kwargs):
     """Create a configured Lana API.
 
     The returned api stores the url for a LANA Process Mining
@@ -61,6 +61,9 @@ def create_api(scheme, host, token, port=None, compatibility=False,
         url:
             (optional) If compatibility is True, you can pass the base url
             as "<scheme>://<host>:<port>/".
+        log_cache_ttl:
+            (optional) A float denoting the number of seconds log listings
+            are cached for, 0 disables caching. Defaults to 5 seconds.
         **kwargs:
             Keyword arguments to pass to requests for the initial
             request retrieving user information.
@@ -75,4 +78,5 @@ def create_api(scheme, host, token, port=None, compatibility=False,
         url = url if url else f'{scheme}://{host}:{port}/'
         return LanaAPI(url, token=token)
 
-    return LanaAPI2(scheme, host, token, port, application_root, **kwargs)
+    return LanaAPI2(scheme, host, token, port, application_root,
+                    log_cache_ttl=log_cache_ttl, **kwargs)
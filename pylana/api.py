@@ -5,6 +5,8 @@ generic api requests including authorization
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from pylana.decorators import handle_response, expect_json
 from pylana.structures import User
@@ -14,6 +16,15 @@ def _create_authorization_header(token: str) -> dict:
     return {"Authorization": f"API-Key {token}"}
 
 
+def _create_session(pool_size: int = 32) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                          max_retries=Retry(total=3, backoff_factor=0.2))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 @expect_json
 @handle_response
 def get_user_information(url, token, **kwargs) -> dict:
@@ -56,6 +67,9 @@ class API:
         headers:
             A dictionary representing the authorization header used for every
             request by default.
+        session:
+            A requests session shared by all requests of the api, keeping
+            connections to the lana api alive between requests.
     """
 
     # TODO document
@@ -91,13 +105,14 @@ class API:
                     ).strip('/')
         self.user = get_user(self.url, token, **kwargs)
         self.headers = _create_authorization_header(token)
+        self.session = _create_session()
 
     def _request(self, method, route, headers=None, additional_headers=None,
                  **kwargs):
         headers = {**self.headers, **(additional_headers or dict()),
                    **(headers or dict())}
-        return requests.request(method, self.url + route, headers=headers,
-                                **kwargs)
+        return self.session.request(method, self.url + route, headers=headers,
+                                    **kwargs)
 
     @handle_response
     def get(self, route, additional_headers=None, **kwargs):
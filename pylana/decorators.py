@@ -3,9 +3,9 @@ decorators for handling api request responses
 """
 
 import functools
-import json
 from typing import List
 
+import orjson
 import requests
 
 
@@ -14,8 +14,8 @@ def expect_json(method):
     def parse_json(*args, **kwargs) -> List[dict]:
         resp = method(*args, **kwargs)
         try:
-            jsn = resp.json()
-        except json.decoder.JSONDecodeError as e:
+            jsn = orjson.loads(resp.content)
+        except orjson.JSONDecodeError as e:
             mime_type = resp.headers.get('Content-Type')
             raise Exception(f'Expected mime-type application/json got {mime_type}')
         return jsn
@@ -4,29 +4,130 @@ log management api requests functions and methods
 
 import io
 import json
+import time
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Union, List, TextIO, BinaryIO, Optional, Iterable
+from typing import Union, List, TextIO, BinaryIO, Optional, Iterable, Iterator
 
+import orjson
 import pandas as pd
 from requests import Response
 
 from pylana.decorators import expect_json
 from pylana.decorators import handle_response
-from pylana.resources import ResourceAPI
+from pylana.resources import ResourceAPI, _match_resource_ids, \
+    _match_unique_resource_id
 from pylana.utils import create_case_semantics_from_df, \
     create_event_semantics_from_df
 
 
-def _serialise_semantics(semantics: Union[str, list]):
-    return \
-        json.dumps(semantics) if not isinstance(semantics, str) else semantics
+_EVENT_CSV_REQUEST_TEMPLATE = (
+    b'{"activityExclusionFilter":[],"includeHeader":true,"includeLogId":false,'
+    b'"logId":%s,"edgeThreshold":1,"traceFilterSequence":[],'
+    b'"runConformance":true,"graphControl":{"sizeControl":"Frequency",'
+    b'"colorControl":"AverageDuration"}}'
+)
+
+
+def _serialise_semantics(semantics: Union[str, bytes, list]) -> Union[str, bytes]:
+    # requests accepts bytes form fields, so there is no need to decode
+    return semantics if isinstance(semantics, (str, bytes)) \
+        else orjson.dumps(semantics)
+
+
+def _serialise_df(df: pd.DataFrame) -> str:
+    # the index is never uploaded, dropping a multi index up front avoids the
+    # slow multi index code path of to_csv
+    if isinstance(df.index, pd.MultiIndex):
+        df = df.reset_index(drop=True)
+    return df.to_csv(index=False)
+
+
+class _CsvChunks:
+    """Iterator over the chunks of a streamed csv response.
+
+    The response holds a pooled connection, it is closed when the chunks are
+    exhausted, on close or when the iterator is garbage collected, whether
+    iterating was started or not.
+    """
+
+    def __init__(self, resp: Response, **kwargs):
+        self._resp = resp
+        self._kwargs = kwargs
+        self._reader = None
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        return self
+
+    def __next__(self) -> pd.DataFrame:
+        if self._resp is None:
+            raise StopIteration
+        try:
+            if self._reader is None:
+                self._resp.raw.decode_content = True
+                # no context manager, readers support it from pandas 1.2 on
+                self._reader = pd.read_csv(self._resp.raw, dtype='object',
+                                           **self._kwargs)
+            return next(self._reader)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._resp is not None:
+            self._resp.close()
+            self._resp = None
+
+    def __del__(self):
+        self.close()
 
 
 class LogsAPI(ResourceAPI):
 
+    def __init__(self, *args, log_cache_ttl: float = 5., **kwargs):
+        super().__init__(*args, **kwargs)
+        self.log_cache_ttl = log_cache_ttl
+        self._log_cache = dict()
+
+    def _request(self, method, route, *args, **kwargs):
+        resp = super()._request(method, route, *args, **kwargs)
+        # modifying log requests might change the listed logs, other
+        # requests like aggregations are posted as well but keep the cache
+        if method != 'GET' and route.startswith('/api/logs'):
+            self.refresh_logs()
+        return resp
+
+    def _list_cached(self, key: str, fetch, **kwargs) -> list:
+        # requests with custom keyword arguments bypass the cache
+        if kwargs or not self.log_cache_ttl:
+            return fetch(**kwargs)
+
+        timestamp, logs = self._log_cache.get(key, (None, None))
+        if timestamp is None \
+                or time.monotonic() - timestamp > self.log_cache_ttl:
+            logs = fetch()
+            self._log_cache[key] = (time.monotonic(), logs)
+        return list(logs)
+
+    def refresh_logs(self):
+        """Invalidate the cached log listings.
+
+        Listings are cached for log_cache_ttl seconds and invalidated by
+        every modifying log request of the api, e.g. uploads, deletions and
+        (un)sharing. Changes made by other clients
+        only show up after the cache expired or this method was called.
+        """
+        self._log_cache.clear()
+
     def list_logs(self, **kwargs) -> list:
         """List all logs that are available to the user.
 
+        Without keyword arguments the listing is cached for log_cache_ttl
+        seconds.
+
         Args:
             **kwargs:
                 Keyword arguments passed to requests functions.
@@ -34,12 +135,15 @@ class LogsAPI(ResourceAPI):
         Returns:
             A list of log names.
         """    
-        return self.list_resources('logs', **kwargs)
+        return self._list_cached(
+            'logs', lambda **kw: self.list_resources('logs', **kw), **kwargs)
 
-    @expect_json
     def list_user_logs(self, **kwargs) -> list:
         """List all logs owned by the user.
 
+        Without keyword arguments the listing is cached for log_cache_ttl
+        seconds.
+
         Args:
             **kwargs:
                 Keyword arguments passed to requests functions.
@@ -47,12 +151,21 @@ class LogsAPI(ResourceAPI):
         Returns: 
             A list of log names.
         """
+        return self._list_cached('user-logs', self._list_user_logs, **kwargs)
+
+    @expect_json
+    def _list_user_logs(self, **kwargs) -> Response:
         return self.get('/api/users/' + self.user.user_id + '/logs', **kwargs)
 
     def get_log_ids(self, contains: str = '.*', **kwargs) -> List[str]:
         """Get all log ids which names are matched by the passed regular
         expression.
 
+        The regular expression is matched on the client side against the
+        listed logs. Query parameters supported by your lana api for
+        narrowing down the listing can be passed as "params" keyword
+        argument, they are forwarded with the listing request.
+
         Args:
             contains:
                 A string denoting a regular expression
@@ -63,7 +176,7 @@ class LogsAPI(ResourceAPI):
         Returns:
             A list of strings denoting log ids.
         """
-        return self.get_resource_ids('logs', contains, **kwargs)
+        return _match_resource_ids(self.list_logs(**kwargs), contains)
 
     def get_log_id(self, contains: str, **kwargs) -> str:
         """Get id of a log by its name.
@@ -80,7 +193,7 @@ class LogsAPI(ResourceAPI):
         Returns:
             A string denoting the id of the log.
         """
-        return self.get_resource_id('logs', contains, **kwargs)
+        return _match_unique_resource_id(self.list_logs(**kwargs), contains)
 
     def describe_log(self, contains: str = None, log_id: str = None,
                      **kwargs) -> dict:
@@ -102,8 +215,9 @@ class LogsAPI(ResourceAPI):
         return self.describe_resource('logs', contains, log_id, **kwargs)
 
     def upload_event_log(self, name,
-                         log: str, log_semantics: Union[str, List[dict]],
-                         case_attributes: Optional[str] = None,
+                         log: Union[str, bytes],
+                         log_semantics: Union[str, List[dict]],
+                         case_attributes: Optional[Union[str, bytes]] = None,
                          case_attribute_semantics: Optional[Union[str, List[dict]]] = None,
                          **kwargs) \
             -> Response:
@@ -113,12 +227,12 @@ class LogsAPI(ResourceAPI):
             name:
                 A string denoting the name for the uploaded log.
             log:
-                A string denoting the event log as csv.
+                A string or bytes denoting the event log as csv.
             log_semantics:
                 The event log semantics either serialised as a
                 string or a list of dictionaries.
             case_attributes:
-                (optional) A string denoting the case
+                (optional) A string or bytes denoting the case
                 attributes as csv.
             case_attribute_semantics:
                 (optional) The event case attributes semantics
@@ -165,6 +279,9 @@ class LogsAPI(ResourceAPI):
         stream. We use the built-in hash function, so it can change when you
         restart the interpreter.
 
+        The streams are read completely into memory before uploading, an
+        empty case attributes stream is not uploaded.
+
         WARNING: This method does not close the passed streams.
 
         Args:
@@ -193,7 +310,8 @@ class LogsAPI(ResourceAPI):
 
         name = f'{prefix}{hash(log)}'
         return self.upload_event_log(name, log.read(), log_semantics,
-                                     case.read(), case_semantics, **kwargs)
+                                     case.read() if case is not None else None,
+                                     case_semantics, **kwargs)
 
     def upload_event_log_df(self, name: str, df_log: pd.DataFrame,
                             time_format: str, df_case: pd.DataFrame,
@@ -262,9 +380,9 @@ class LogsAPI(ResourceAPI):
         )
 
         return self.upload_event_log(name,
-                                     log=df_log.to_csv(index=False),
+                                     log=_serialise_df(df_log),
                                      log_semantics=log_semantics,
-                                     case_attributes=df_case.to_csv(index=False),
+                                     case_attributes=_serialise_df(df_case),
                                      case_attribute_semantics=case_semantics, **kwargs)
 
     def upload_event_log_file(self, name: str,
@@ -375,7 +493,7 @@ class LogsAPI(ResourceAPI):
 
         files = {
             'eventCSVFile': ('event-file',
-                             df_log.to_csv(index=False),
+                             _serialise_df(df_log),
                              'text/csv')}
         semantics = {'eventSemantics': _serialise_semantics(event_semantics)}
 
@@ -405,7 +523,7 @@ class LogsAPI(ResourceAPI):
 
         files = {
             'caseAttributeFile': ('event-file',
-                                  df_case.to_csv(index=False),
+                                  _serialise_df(df_case),
                                   'text/csv')}
         semantics = {'caseSemantics': _serialise_semantics(case_semantics)}
 
@@ -427,9 +545,12 @@ class LogsAPI(ResourceAPI):
         return self.delete_resource('logs', log_id, **kwargs)
 
     def delete_logs(self, log_ids: List[str] = None, contains: str = None,
-                    **kwargs) -> List[Response]:
+                    max_workers: int = 8, **kwargs) -> List[Response]:
         """Delete one or multiple logs.
-        
+
+        The delete requests are sent concurrently, each id is only deleted
+        once.
+
         Args:
             log_ids:
                 A list of strings denoting the ids of logs to delete. Tales
@@ -437,13 +558,19 @@ class LogsAPI(ResourceAPI):
             contains:
                 A string denoting a regular expression matched against
                 the log names.
+            max_workers:
+                (optional) An integer denoting the maximum number of
+                concurrent delete requests. Defaults to 8.
             **kwargs:
                 Keyword arguments passed to requests functions.
 
         Returns:
-            The requests response of the lana api call.
+            The requests responses of the lana api calls, one per unique log
+            id in the order of their first occurrence. The list is shorter
+            than log_ids if it contains duplicates.
         """
-        return self.delete_resources('logs', contains, log_ids, **kwargs)
+        return self.delete_resources('logs', contains, log_ids,
+                                     max_workers=max_workers, **kwargs)
 
     def request_event_csv(self, log_id: str,
                           mining_request: Optional[dict] = None,
@@ -463,19 +590,16 @@ class LogsAPI(ResourceAPI):
             The requests response of the lana api call. The event log can be
             accessed under the text attribute of the response.
         """
-        request_field = json.dumps(mining_request) if mining_request else json.dumps({
-            'activityExclusionFilter': [],
-            'includeHeader': True,
-            'includeLogId': False,
-            'logId': log_id,
-            'edgeThreshold': 1,
-            'traceFilterSequence': [], 'runConformance': True,
-            'graphControl': {'sizeControl': 'Frequency', 'colorControl': 'AverageDuration'}})
+        # user supplied requests keep the json module's handling of NaN and
+        # non-str keys, which orjson rejects or serialises differently
+        request_field = json.dumps(mining_request) if mining_request else \
+            (_EVENT_CSV_REQUEST_TEMPLATE % orjson.dumps(log_id)).decode()
         return self.get(f'/api/eventCsvWithFilter?request={request_field}', **kwargs)
 
     def get_event_log(self, log_name: str = None, log_id: str = None,
                       mining_request: Optional[dict] = None,
-                      **kwargs) -> pd.DataFrame:
+                      engine: str = 'c', chunksize: Optional[int] = None,
+                      **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """Get the enriched event log as a pandas data frame
 
         Only columns with time stamps are type cast, the other columns
@@ -491,19 +615,43 @@ class LogsAPI(ResourceAPI):
             mining_request:
                 (optional) A mining request data structure sent with
                 request to filter down the log.
+            engine:
+                (optional) A string denoting the pandas csv parser engine.
+                Passing "pyarrow" parses considerably faster, but requires
+                pyarrow and pandas 1.4 or newer, and the column types are
+                inferred instead of kept as objects. Defaults to "c".
+            chunksize:
+                (optional) An integer denoting the number of rows per chunk.
+                If passed, the log is downloaded as a stream and an iterator
+                over data frames is returned, parsing the chunks while they
+                arrive. The iterator keeps a connection open until it is
+                exhausted, closed by its close method or garbage collected.
+                Not supported by the "pyarrow" engine.
             **kwargs:
                 Keyword arguments passed to requests functions.
 
         Returns:
-            A data frame denoting the enriched log.
+            A data frame denoting the enriched log, or an iterator over data
+            frames if chunksize is passed.
         """
 
         log_id = log_id or self.get_log_id(log_name)
+        if chunksize:
+            kwargs.pop('stream', None)
+            resp = self.request_event_csv(log_id, mining_request,
+                                          stream=True, **kwargs)
+            if resp.status_code >= 400:
+                resp.close()
+                return iter([])
+            return _CsvChunks(resp, engine=engine, chunksize=chunksize)
+
         resp = self.request_event_csv(log_id, mining_request, **kwargs)
         if resp.status_code >= 400:
             return pd.DataFrame()
         csv_stream = io.BytesIO(resp.content)
-        return pd.read_csv(csv_stream, dtype='object')
+        if engine == 'pyarrow':
+            return pd.read_csv(csv_stream, engine='pyarrow')
+        return pd.read_csv(csv_stream, dtype='object', engine=engine)
 
     @handle_response
     def share_log(self, log_id: str) -> Response:
@@ -516,7 +664,9 @@ class LogsAPI(ResourceAPI):
         Returns:
             The requests response of the lana api call.
         """
-        return self.get(f'/api/shareLogWithOrg/{log_id}')
+        resp = self.get(f'/api/shareLogWithOrg/{log_id}')
+        self.refresh_logs()
+        return resp
 
     @handle_response
     def unshare_log(self, log_id: str) -> Response:
@@ -529,40 +679,48 @@ class LogsAPI(ResourceAPI):
         Returns:
             The requests response of the lana api call.
         """
-        return self.get(f'/api/unshareLogWithOrg/{log_id}')
+        resp = self.get(f'/api/unshareLogWithOrg/{log_id}')
+        self.refresh_logs()
+        return resp
 
 
     # legacy methods
     # --------------
 
     def uploadEventLog(self, logFile, logSemantics):
-        file = {
-            'file': open(logFile, 'rb'),
-        }
+        with open(logFile, 'rb') as log, open(logSemantics) as log_semantics:
+            file = {
+                'file': log,
+            }
 
-        semantics = {
-            'eventSemantics': open(logSemantics).read(),
-        }
+            semantics = {
+                'eventSemantics': log_semantics.read(),
+            }
 
-        return self.post('/api/logs/csv', files=file, data=semantics)
+            return self.post('/api/logs/csv', files=file, data=semantics)
 
     def uploadEventLogWithCaseAttributes(self, logFile, logSemantics,
                                          caseAttributeFile, caseAttributeSemantics, logName=None):
 
-        files = {
-            'eventCSVFile': (Path(logFile).name, open(logFile, 'rb'), 'text/csv'),
-            'caseAttributesFile': (Path(caseAttributeFile).name, open(caseAttributeFile, 'rb'), 'text/csv'),
-        }
+        with ExitStack() as stack:
+            files = {
+                'eventCSVFile': (Path(logFile).name,
+                                 stack.enter_context(open(logFile, 'rb')),
+                                 'text/csv'),
+                'caseAttributesFile': (Path(caseAttributeFile).name,
+                                       stack.enter_context(open(caseAttributeFile, 'rb')),
+                                       'text/csv'),
+            }
 
-        semantics = {
-            'eventSemantics': open(logSemantics).read(),
-            'caseSemantics': open(caseAttributeSemantics).read(),
-            'logName': logName,
-            'timeZone': "Europe/Berlin"
-        }
+            semantics = {
+                'eventSemantics': stack.enter_context(open(logSemantics)).read(),
+                'caseSemantics': stack.enter_context(open(caseAttributeSemantics)).read(),
+                'logName': logName,
+                'timeZone': "Europe/Berlin"
+            }
 
-        return self.post('/api/logs/csv-case-attributes-event-semantics',
-                         files=files, data=semantics)
+            return self.post('/api/logs/csv-case-attributes-event-semantics',
+                             files=files, data=semantics)
 
     def getUserLogs(self):
         return self.list_user_logs()
@@ -574,15 +732,18 @@ class LogsAPI(ResourceAPI):
 
     @handle_response
     def appendEvents(self, logId: str, logFile, logSemantics):
-        file = {'eventCSVFile': open(logFile, 'rb')}
-        semantics = {'eventSemantics': open(logSemantics).read()}
+        with open(logFile, 'rb') as log, open(logSemantics) as log_semantics:
+            file = {'eventCSVFile': log}
+            semantics = {'eventSemantics': log_semantics.read()}
 
-        return self.post('/api/logs/' + logId + '/csv', files=file, data=semantics)
+            return self.post('/api/logs/' + logId + '/csv', files=file, data=semantics)
 
     @handle_response
     def appendAttributes(self, logId, caseAttributeFile, caseAttributeSemantics):
-        file = {'caseAttributeFile': open(caseAttributeFile, 'rb')}
-        semantics = {'caseSemantics': open(caseAttributeSemantics).read()}
+        with open(caseAttributeFile, 'rb') as case_attributes, \
+                open(caseAttributeSemantics) as case_semantics:
+            file = {'caseAttributeFile': case_attributes}
+            semantics = {'caseSemantics': case_semantics.read()}
 
-        return self.post('/api/logs/' + logId + '/csv-case-attributes',
-                         files=file, data=semantics)
+            return self.post('/api/logs/' + logId + '/csv-case-attributes',
+                             files=file, data=semantics)
@@ -2,8 +2,10 @@
 resource management api requests
 """
 
+import functools
 import re
-from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Union
 
 from requests import Response
 
@@ -11,6 +13,44 @@ from pylana.api import API
 from pylana.decorators import expect_json
 
 
+_REGEX_SPECIAL_CHARACTERS = re.compile(r'[\\^$.*+?()\[\]{}|]')
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_matcher(pattern: str) -> Callable[[str], bool]:
+    # patterns without special characters are plain substrings, for which
+    # the substring search of str is a lot faster than a regex search
+    if not _REGEX_SPECIAL_CHARACTERS.search(pattern):
+        return lambda name: pattern in name
+    return re.compile(pattern).search
+
+
+def _match_resource_ids(resources: List[dict], contains: str) -> List[str]:
+    matches_name = _compile_matcher(contains)
+    return [
+        resource.get('id') or resource.get('pageId')
+        for resource in resources if matches_name(resource.get('name')
+        or resource.get('title'))
+    ]
+
+
+def _match_unique_resource_id(resources: List[dict], contains: str) -> str:
+    # stops at the second match, which is enough to reject the pattern
+    matches_name = _compile_matcher(contains)
+    matches = []
+    for resource in resources:
+        if matches_name(resource.get('name') or resource.get('title')):
+            matches.append(resource)
+            if len(matches) > 1:
+                raise Exception(
+                    f'Found more than one resource with the pattern {contains}')
+
+    if not matches:
+        raise Exception(f'Found 0 resources with the pattern {contains}')
+    [resource] = matches
+    return resource.get('id') or resource.get('pageId')
+
+
 class ResourceAPI(API):
 
     @expect_json
@@ -43,13 +83,7 @@ class ResourceAPI(API):
             a list of strings representing resource ids
         """
         resources = self.list_resources(kind, **kwargs)
-        rc = re.compile(contains)
-        
-        return [
-            resource.get('id') or resource.get('pageId')
-            for resource in resources if rc.search(resource.get('name') 
-            or resource.get('title'))
-        ]
+        return _match_resource_ids(resources, contains)
 
     def get_resource_id(self, kind: str, contains: str, **kwargs) -> str:
         """
@@ -57,15 +91,8 @@ class ResourceAPI(API):
 
         name needs to be unique or an exception is raised
         """
-        resource_ids = self.get_resource_ids(kind, contains, **kwargs)
-
-        try:
-            [resource_id] = resource_ids
-        except ValueError as e:
-            raise Exception(
-                f'Found {len(resource_ids)} resources with the pattern {contains}')
-
-        return resource_id
+        resources = self.list_resources(kind, **kwargs)
+        return _match_unique_resource_id(resources, contains)
 
 
     @expect_json
@@ -94,12 +121,22 @@ class ResourceAPI(API):
         """
         return self.delete(f'/api/{kind}/{id_}', **kwargs)
 
-    def delete_resources(self, kind: str, contains: str = None, ids: List[str] = None, **kwargs) -> List[Response]:
+    def delete_resources(self, kind: str, contains: str = None, ids: List[str] = None,
+                         max_workers: int = 8, **kwargs) -> List[Response]:
         """
         deletes one or multiple logs matching the passed regular expression
+
+        the delete requests are sent concurrently by up to max_workers threads,
+        responses are returned in the order of the unique ids
         """
-        ids = ids or self.get_resource_ids(kind, contains, **kwargs)
-        return [self.delete_resource(kind, id_) for id_ in ids]
+        # duplicate ids would only cost an additional round trip each
+        ids = list(dict.fromkeys(ids or self.get_resource_ids(kind, contains, **kwargs)))
+        if not ids:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(ids))) as executor:
+            return list(executor.map(
+                lambda id_: self.delete_resource(kind, id_), ids))
 
     def connect_resources(self, dct, **kwargs) -> Response:
         return self.post('/api/v2/resource-connections', json=dct, **kwargs)
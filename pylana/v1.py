@@ -5,6 +5,7 @@ The to-be phased out legacy PyLana API.
 import json
 import re
 import zipfile
+from contextlib import ExitStack
 from os.path import basename
 
 import pandas as pd
@@ -41,15 +42,16 @@ class LanaAPI:
     def uploadEventLog(self, logFile, logSemantics):
         endpoint = 'api/logs/csv'
 
-        file = {
-            'file': open(logFile, 'rb'),
-        }
+        with open(logFile, 'rb') as log, open(logSemantics) as log_semantics:
+            file = {
+                'file': log,
+            }
 
-        semantics = {
-            'eventSemantics': open(logSemantics).read(),
-        }
+            semantics = {
+                'eventSemantics': log_semantics.read(),
+            }
 
-        r = requests.post(self.url + endpoint, headers=self.headers, files=file, data=semantics)
+            r = requests.post(self.url + endpoint, headers=self.headers, files=file, data=semantics)
         return r
 
     def uploadEventLogWithCaseAttributes(self, logFile, logSemantics,
@@ -57,19 +59,20 @@ class LanaAPI:
 
         endpoint = 'api/logs/csv-case-attributes-event-semantics'
 
-        files = {
-            'eventCSVFile': (logFile.split('/')[-1], open(logFile, 'rb'), 'text/csv'),
-            'caseAttributeFile': (caseAttributeFile.split('/')[-1], open(caseAttributeFile, 'rb'), 'text/csv'),
-        }
+        with ExitStack() as stack:
+            files = {
+                'eventCSVFile': (logFile.split('/')[-1], stack.enter_context(open(logFile, 'rb')), 'text/csv'),
+                'caseAttributeFile': (caseAttributeFile.split('/')[-1], stack.enter_context(open(caseAttributeFile, 'rb')), 'text/csv'),
+            }
 
-        semantics = {
-            'eventSemantics': open(logSemantics).read(),
-            'caseSemantics': open(caseAttributeSemantics).read(),
-            'logName': logName,
-            'timeZone': "Europe/Berlin"
-        }
+            semantics = {
+                'eventSemantics': stack.enter_context(open(logSemantics)).read(),
+                'caseSemantics': stack.enter_context(open(caseAttributeSemantics)).read(),
+                'logName': logName,
+                'timeZone': "Europe/Berlin"
+            }
 
-        upload_response = requests.request('POST', self.url + endpoint, headers=self.headers, files=files, data=semantics)
+            upload_response = requests.request('POST', self.url + endpoint, headers=self.headers, files=files, data=semantics)
         
         return upload_response
 
@@ -85,17 +88,20 @@ class LanaAPI:
 
     def appendEvents(self, logId, logFile, logSemantics):
         appendEventsEndpoint = 'api/logs/' + str(logId) + '/csv'
-        file = {'eventCSVFile': open(logFile, 'rb')}
-        semantics = {'eventSemantics': open(logSemantics).read()}
+        with open(logFile, 'rb') as log, open(logSemantics) as log_semantics:
+            file = {'eventCSVFile': log}
+            semantics = {'eventSemantics': log_semantics.read()}
 
-        requests.post(self.url + appendEventsEndpoint, headers=self.headers, files=file, data=semantics, verify=False)
+            requests.post(self.url + appendEventsEndpoint, headers=self.headers, files=file, data=semantics, verify=False)
 
     def appendAttributes(self, logId, caseAttributeFile, caseAttributeSemantics):
         appendEventsEndpoint = 'api/logs/' + str(logId) + '/csv-case-attributes'
-        file = {'caseAttributeFile': open(caseAttributeFile, 'rb')}
-        semantics = {'caseSemantics': open(caseAttributeSemantics).read()}
+        with open(caseAttributeFile, 'rb') as case_attributes, \
+                open(caseAttributeSemantics) as case_semantics:
+            file = {'caseAttributeFile': case_attributes}
+            semantics = {'caseSemantics': case_semantics.read()}
 
-        requests.post(self.url + appendEventsEndpoint, headers=self.headers, files=file, data=semantics, verify=False)
+            requests.post(self.url + appendEventsEndpoint, headers=self.headers, files=file, data=semantics, verify=False)
 
     def shareLogWithOrg(self, logId):
         shareLogWithOrgEndpoint = 'api/shareLogWithOrg/' + str(logId)
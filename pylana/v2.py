@@ -31,5 +31,7 @@ class LanaAPI2(LogsAPI, ShinyDashboardAPI, DashboardAPI, UsersAPI, AggregationAP
             A User dataclass encapsulating the user of the api information.
         headers (dict):
             The authorization header used for every request by default.
+        log_cache_ttl (float):
+            The number of seconds log listings are cached for.
     """
     pass
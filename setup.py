@@ -32,6 +32,7 @@ setup(name='pylana',
       install_requires=[
           'requests',
           'pandas',
+          'orjson',
       ],
       packages=find_packages(),
 )
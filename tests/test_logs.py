@@ -1,12 +1,127 @@
+import io
 import json
 import unittest
+from unittest import mock
 
+import orjson
 import pandas as pd
 
 from pylana import create_api
+from pylana.api import API
+from pylana.logs import LogsAPI, _CsvChunks, _EVENT_CSV_REQUEST_TEMPLATE, \
+    _serialise_df
 from pylana.utils import create_semantics
 
 
+class TestLogCacheInvalidation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # skip the constructor, it requests the user information
+        self.api = LogsAPI.__new__(LogsAPI)
+        self.api._log_cache = {'logs': (0., [])}
+
+    @mock.patch.object(API, '_request')
+    def test_log_requests_invalidate(self, _):
+        self.api._request('POST', '/api/logs/csv-case-attributes-event-semantics')
+        self.assertEqual(self.api._log_cache, {})
+
+        self.api._log_cache['logs'] = (0., [])
+        self.api._request('DELETE', '/api/logs/some-log-id')
+        self.assertEqual(self.api._log_cache, {})
+
+    @mock.patch.object(API, '_request')
+    def test_other_requests_keep_cache(self, _):
+        self.api._request('GET', '/api/logs')
+        self.api._request('POST', '/api/v2/aggregate-data')
+        self.api._request('POST', '/api/v2/dashboards')
+        self.assertIn('logs', self.api._log_cache)
+
+
+class TestCsvChunks(unittest.TestCase):
+
+    @staticmethod
+    def create_response():
+        resp = mock.Mock()
+        resp.raw = io.BytesIO(b'Case_ID,Action\n1,A\n2,B\n3,C\n')
+        return resp
+
+    def test_exhausted(self):
+        resp = self.create_response()
+        chunks = list(_CsvChunks(resp, chunksize=2))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        self.assertEqual(chunks[0].loc[0, 'Case_ID'], '1')
+        resp.close.assert_called_once()
+
+    def test_closed_before_iterating(self):
+        resp = self.create_response()
+        chunks = _CsvChunks(resp, chunksize=2)
+        chunks.close()
+
+        resp.close.assert_called_once()
+        self.assertEqual(list(chunks), [])
+
+    def test_dropped_before_iterating(self):
+        resp = self.create_response()
+        _ = _CsvChunks(resp, chunksize=2)
+        del _
+
+        resp.close.assert_called_once()
+
+
+class TestEventCsvRequestTemplate(unittest.TestCase):
+
+    def test_template_matches_default_request(self):
+        expected = {
+            'activityExclusionFilter': [],
+            'includeHeader': True,
+            'includeLogId': False,
+            'logId': 'x',
+            'edgeThreshold': 1,
+            'traceFilterSequence': [], 'runConformance': True,
+            'graphControl': {'sizeControl': 'Frequency', 'colorControl': 'AverageDuration'}}
+
+        actual = orjson.loads(_EVENT_CSV_REQUEST_TEMPLATE % orjson.dumps('x'))
+
+        self.assertEqual(actual, expected)
+
+
+class TestSerialiseDf(unittest.TestCase):
+
+    def assert_serialised_like_to_csv(self, df):
+        expected_csv = df.to_csv(index=False)
+        expected_df = df.copy(deep=True)
+
+        actual = _serialise_df(df)
+
+        self.assertEqual(actual, expected_csv)
+        pd.testing.assert_frame_equal(df, expected_df)
+
+    def test_integer_columns(self):
+        df = pd.DataFrame({
+            'Case_ID': [1, 2, 3],
+            'Large': [2 ** 40, -2 ** 40, 0],
+            'Number': [1.1, 2.2, 3.3],
+            'Action': ['A', 'B', 'C'],
+            'Start': pd.to_datetime(['2020-02-02 12:00:00'] * 3)})
+
+        self.assert_serialised_like_to_csv(df)
+        self.assertEqual(df.dtypes['Case_ID'], 'int64')
+
+    def test_multi_index(self):
+        df = pd.DataFrame(
+            {'Case_ID': [1, 2, 3], 'Action': ['A', 'B', 'C']},
+            index=pd.MultiIndex.from_tuples([('a', 1), ('a', 2), ('b', 1)]))
+
+        self.assert_serialised_like_to_csv(df)
+
+    def test_duplicate_columns(self):
+        df = pd.DataFrame([[1, 2, 'A'], [3, 4, 'B']],
+                          columns=['Case_ID', 'Case_ID', 'Action'])
+
+        self.assert_serialised_like_to_csv(df)
+
+
 class TestLogsAPI(unittest.TestCase):
 
     @classmethod
@@ -20,6 +135,17 @@ class TestLogsAPI(unittest.TestCase):
         _ = self.api.list_user_logs()
         _ = self.api.get('/invalid-route')
 
+    def test_list_cache(self):
+        logs = self.api.list_logs()
+        self.assertEqual(self.api.list_logs(), logs)
+        self.assertIn('logs', self.api._log_cache)
+
+        self.api.refresh_logs()
+        self.assertNotIn('logs', self.api._log_cache)
+
+        _ = self.api.list_logs(timeout=60)
+        self.assertNotIn('logs', self.api._log_cache)
+
     def test_describe(self):
         log = self.api.describe_log('Incident.*')
         self.assertIsInstance(log.get('id'), str)
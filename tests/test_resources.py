@@ -0,0 +1,67 @@
+import re
+import unittest
+
+from pylana.resources import _compile_matcher, _match_resource_ids, \
+    _match_unique_resource_id
+
+
+class TestMatchResources(unittest.TestCase):
+
+    names = ['Incident_Management', 'incident-management', 'pylana-test-log',
+             'pylana-test-log-from-df', 'a.b', 'axb', '']
+
+    resources = [
+        {'id': '1', 'name': 'Incident_Management'},
+        {'id': '2', 'name': 'pylana-test-log'},
+        {'id': '3', 'name': 'pylana-test-log-from-df'},
+        {'pageId': '4', 'title': 'Dashboard'}
+    ]
+
+    def test_literal_patterns_match_like_regex(self):
+        for pattern in ['Incident', 'pylana-test', 'management', 'axb', '']:
+            matches = _compile_matcher(pattern)
+            for name in self.names:
+                msg = f'pattern {pattern!r} on name {name!r}'
+                self.assertEqual(bool(matches(name)),
+                                 bool(re.search(pattern, name)), msg)
+
+    def test_regex_patterns_match_like_regex(self):
+        for pattern in ['.*', 'a.b', '^pylana', 'log$', 'Incident|incident',
+                        'pylana-test-log(-from-df)?', '[Ii]ncident']:
+            matches = _compile_matcher(pattern)
+            for name in self.names:
+                msg = f'pattern {pattern!r} on name {name!r}'
+                self.assertEqual(bool(matches(name)),
+                                 bool(re.search(pattern, name)), msg)
+
+        for pattern in ['.*', 'a.b', '^pylana', 'log$', 'a|b', '(a)', '[a]',
+                        'a+', 'a?', 'a{2}', r'\d']:
+            self.assertIsInstance(
+                getattr(_compile_matcher(pattern), '__self__', None),
+                re.Pattern, f'pattern {pattern!r} did not use a regex')
+        for pattern in ['Incident', 'pylana-test', 'a b']:
+            self.assertNotIsInstance(
+                getattr(_compile_matcher(pattern), '__self__', None),
+                re.Pattern, f'pattern {pattern!r} used a regex')
+
+        self.assertFalse(_compile_matcher('a.b')('a-c'))
+        self.assertTrue(_compile_matcher('a.b')('axb'))
+
+    def test_match_resource_ids(self):
+        self.assertEqual(_match_resource_ids(self.resources, 'pylana'),
+                         ['2', '3'])
+        self.assertEqual(_match_resource_ids(self.resources, 'log$'), ['2'])
+        self.assertEqual(_match_resource_ids(self.resources, 'Dash'), ['4'])
+        self.assertEqual(_match_resource_ids(self.resources, 'not-a-name'), [])
+
+    def test_match_unique_resource_id(self):
+        self.assertEqual(
+            _match_unique_resource_id(self.resources, 'Incident'), '1')
+        self.assertEqual(
+            _match_unique_resource_id(self.resources, 'log$'), '2')
+
+        with self.assertRaisesRegex(Exception, 'Found 0 resources'):
+            _match_unique_resource_id(self.resources, 'not-a-name')
+
+        with self.assertRaisesRegex(Exception, 'more than one resource'):
+            _match_unique_resource_id(self.resources, 'pylana')